@@ -143,10 +143,17 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
 
             return tuple(params.values())
 
-        name, *params = custom_id.split(self.sep)
+        sep = t.cast(str, self.sep)  # Always set if no custom regex is used.
+        param_count = len(self.params)
+
+        # Confirm the number of incoming params matches the number of params on the listener.
+        # This is checked before splitting so that mismatching custom_ids are never split.
+        if custom_id.count(sep) != param_count:
+            raise ValueError(f"Listener spec {self.id_spec} did not match custom_id {custom_id}.")
+
+        name, *params = custom_id.split(sep, param_count)
         # If no name is set, skip name check. Otherwise, assure stored and provided name are equal.
-        # Also confirm the number of incoming params matches the number of params on the listener.
-        if (self.name and name != self.name) or (len(params) != len(self.params)):
+        if self.name and name != self.name:
             raise ValueError(f"Listener spec {self.id_spec} did not match custom_id {custom_id}.")
 
         return tuple(params)
@@ -187,14 +194,18 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
             kwargs.update(args_as_kwargs)  # This is safe as we ensured there is no overlap.
 
         # "Serialize" types to strings; empty string for None (optional)...
-        serialized_kwargs = {
-            param.name: "" if kwargs[param.name] is None else await param.to_str(kwargs[param.name])
+        serialized = [
+            "" if kwargs[param.name] is None else await param.to_str(kwargs[param.name])
             for param in self.params
-        }
+        ]
 
         if self.regex:
-            custom_id = self.id_spec.format(**serialized_kwargs)
-        custom_id = self.id_spec.format(sep=self.sep, **serialized_kwargs)
+            custom_id = self.id_spec.format(
+                **{param.name: value for param, value in zip(self.params, serialized)}
+            )
+        else:
+            # Equivalent to formatting the id spec, without having to parse it every time.
+            custom_id = t.cast(str, self.sep).join((self.name or "", *serialized))
 
         if not custom_id:  # Fallback in case the listener has neither a name nor params.
             return self.__name__
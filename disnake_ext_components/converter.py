@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import typing as t
 
@@ -38,6 +39,51 @@ class ALLOW_CONVERTER_FETCHING:  # There's probably a better way of doing this..
     """Whether or not to allow converters to fetch a message if getting it from cache fails."""
 
 
+_PENDING_CHANNEL_FETCHES: t.Dict[t.Tuple[disnake.Client, int], asyncio.Future[t.Any]] = {}
+"""Channel fetches that are currently in progress, keyed by bot and channel id. Used to make
+concurrent conversions of the same channel share a single request.
+"""
+
+
+_BOOL_MAP: t.Mapping[str, bool] = {
+    **dict.fromkeys(("true", "t", "yes", "y", "1", "enable", "on"), True),
+    **dict.fromkeys(("false", "f", "no", "n", "0", "disable", "off"), False),
+    # Output of str(bool), as used to store booleans in custom_ids.
+    "True": True,
+    "False": False,
+}
+"""A mapping of all strings that can be converted to a :class:`bool`. Any other casing of these
+strings is handled by lowercasing the input.
+"""
+
+
+def bool_converter(argument: str) -> bool:
+    """Convert a string to a :class:`bool`. This is case-insensitive, and supports the same
+    values as :data:`.patterns.BOOL`.
+
+    Parameters
+    ----------
+    argument: :class:`str`
+        The string to be converted.
+
+    Raises
+    ------
+    ValueError:
+        The argument could not be converted into a :class:`bool`.
+
+    Returns
+    -------
+    :class:`bool`
+        The converted boolean.
+    """
+    # Input is usually an exact match; only create a lowered copy if the direct lookup fails.
+    if (result := _BOOL_MAP.get(argument)) is None:
+        if (result := _BOOL_MAP.get(argument.lower())) is None:
+            raise ValueError(f"Could not convert {argument!r} to a boolean.")
+
+    return result
+
+
 def collection_converter(
     collection_type: t.Type[CollectionT],
     inner_converter: ConverterSig,
@@ -62,25 +108,72 @@ def collection_converter(
     return _convert_collection
 
 
-def make_channel_converter(type_: t.Type[ChannelT]) -> t.Callable[..., types_.Coro[ChannelT]]:
-    """Create a channel converter for a given channel type."""
+def make_channel_converter(
+    type_: t.Type[ChannelT],
+) -> t.Callable[..., t.Union[ChannelT, types_.Coro[ChannelT]]]:
+    """Create a channel converter for a given channel type.
+
+    The returned converter is not a coroutine function: it returns the channel directly if it is
+    cached, and only returns a coroutine that resolves to the channel if the channel has to be
+    fetched. Callers must therefore check whether its return value is awaitable before awaiting
+    it, e.g. using :func:`inspect.isawaitable`.
+
+    Parameters
+    ----------
+    type_: Type[Union[:class:`disnake.abc.GuildChannel`, :class:`disnake.Thread`]]
+        The type of channel the converter should convert to.
+
+    Returns
+    -------
+    Callable[[:class:`str`, :class:`disnake.Interaction`], Union[ChannelT, Coroutine[ChannelT]]]
+        The channel converter. The converter raises :class:`ValueError` if no channel of the
+        provided type exists with the provided id.
+    """
 
-    async def _convert_channel(argument: str, inter: disnake.Interaction) -> ChannelT:
+    def _convert_channel(
+        argument: str, inter: disnake.Interaction
+    ) -> t.Union[ChannelT, types_.Coro[ChannelT]]:
         id = int(argument)
-        if not (channel := inter.bot.get_channel(id)) and ALLOW_CONVERTER_FETCHING.CHANNELS:
-            channel = await inter.bot.fetch_channel(id)
+        # Components commonly refer to the channel they were sent in; skip the cache lookup.
+        if inter.channel_id == id and isinstance(channel := inter.channel, type_):
+            return channel
+
+        if isinstance(channel := inter.bot.get_channel(id), type_):
+            return channel
 
-        if not channel or not isinstance(channel, type_):
+        if channel or not ALLOW_CONVERTER_FETCHING.CHANNELS:
             raise ValueError(f"Could not find a channel of type {type_!r} with id {argument}.")
 
+        return _fetch_channel(id, inter)
+
+    async def _fetch_channel(id: int, inter: disnake.Interaction) -> ChannelT:
+        key = (inter.bot, id)
+        if (fetch := _PENDING_CHANNEL_FETCHES.get(key)) is None:
+            fetch = _PENDING_CHANNEL_FETCHES[key] = asyncio.ensure_future(
+                inter.bot.fetch_channel(id)
+            )
+            fetch.add_done_callback(lambda _: _PENDING_CHANNEL_FETCHES.pop(key, None))
+
+        try:
+            # Shield the shared fetch so that cancelling one conversion doesn't cancel the others.
+            channel = await asyncio.shield(fetch)
+        except disnake.NotFound:
+            channel = None
+
+        if not isinstance(channel, type_):
+            raise ValueError(f"Could not find a channel of type {type_!r} with id {id}.")
+
         return channel
 
     return _convert_channel
 
 
-async def user_converter(argument: str, inter: disnake.Interaction) -> disnake.User:
+def user_converter(
+    argument: str, inter: disnake.Interaction
+) -> t.Union[disnake.User, types_.Coro[disnake.User]]:
     """Convert a user id to a :class:`disnake.User` in the context of the provided
-    :class:`disnake.Interaction`.
+    :class:`disnake.Interaction`. The user is returned directly if it is cached; a coroutine is
+    only returned if the user has to be fetched.
 
     Parameters
     ----------
@@ -91,27 +184,40 @@ async def user_converter(argument: str, inter: disnake.Interaction) -> disnake.U
 
     Raises
     ------
-    commands.UserNotFound:
-        The argument could not be converted into a :class:`disnake.User`.
+    ValueError:
+        The argument could not be converted into a :class:`disnake.User`. If the user has to
+        be fetched, this is raised when awaiting the returned coroutine instead.
 
     Returns
     -------
-    :class:`disnake.User`
-        The user with the provided user id.
+    Union[:class:`disnake.User`, Coroutine[:class:`disnake.User`]]
+        The user with the provided user id if it is cached, otherwise a coroutine that fetches
+        it. Check whether the result is awaitable before awaiting it.
     """
     id = int(argument)
-    if not (user := inter.bot.get_user(id)) and ALLOW_CONVERTER_FETCHING.USERS:
-        user = await inter.bot.fetch_user(id)
+    if user := inter.bot.get_user(id):
+        return user
 
-    if not user:
+    if not ALLOW_CONVERTER_FETCHING.USERS:
         raise ValueError(f"Could not find a user with id {argument}.")
 
-    return user
+    return _fetch_user(id, inter)
 
 
-async def guild_converter(argument: str, inter: disnake.Interaction) -> disnake.Guild:
+async def _fetch_user(id: int, inter: disnake.Interaction) -> disnake.User:
+    """For internal use only. Fetch a user for :func:`user_converter` if it isn't cached."""
+    try:
+        return await inter.bot.fetch_user(id)
+    except disnake.NotFound:
+        raise ValueError(f"Could not find a user with id {id}.") from None
+
+
+def guild_converter(
+    argument: str, inter: disnake.Interaction
+) -> t.Union[disnake.Guild, types_.Coro[disnake.Guild]]:
     """Convert a guild id to a :class:`disnake.Guild` in the context of the provided
-    :class:`disnake.Interaction`.
+    :class:`disnake.Interaction`. The guild is returned directly if it is cached; a coroutine is
+    only returned if the guild has to be fetched.
 
     Parameters
     ----------
@@ -122,22 +228,32 @@ async def guild_converter(argument: str, inter: disnake.Interaction) -> disnake.
 
     Raises
     ------
-    commands.GuildNotFound:
-        The argument could not be converted into a :class:`disnake.Guild`.
+    ValueError:
+        The argument could not be converted into a :class:`disnake.Guild`. If the guild has to
+        be fetched, this is raised when awaiting the returned coroutine instead.
 
     Returns
     -------
-    :class:`disnake.Guild`
-        The guild with the provided guild id.
+    Union[:class:`disnake.Guild`, Coroutine[:class:`disnake.Guild`]]
+        The guild with the provided guild id if it is cached, otherwise a coroutine that fetches
+        it. Check whether the result is awaitable before awaiting it.
     """
     id = int(argument)
-    if not (guild := inter.bot.get_guild(id)) and ALLOW_CONVERTER_FETCHING.GUILDS:
-        guild = await inter.bot.fetch_guild(id)
+    if guild := inter.bot.get_guild(id):
+        return guild
 
-    if not guild:
+    if not ALLOW_CONVERTER_FETCHING.GUILDS:
         raise ValueError(f"Could not find a guild with id {argument}.")
 
-    return guild
+    return _fetch_guild(id, inter)
+
+
+async def _fetch_guild(id: int, inter: disnake.Interaction) -> disnake.Guild:
+    """For internal use only. Fetch a guild for :func:`guild_converter` if it isn't cached."""
+    try:
+        return await inter.bot.fetch_guild(id)
+    except disnake.NotFound:
+        raise ValueError(f"Could not find a guild with id {id}.") from None
 
 
 async def message_converter(
@@ -177,7 +293,10 @@ async def message_converter(
         raise commands.MessageNotFound(argument)
 
     async def _underlying(channel: disnake.abc.Messageable) -> t.Optional[disnake.Message]:
-        return await channel.fetch_message(id)
+        try:
+            return await channel.fetch_message(id)
+        except disnake.NotFound:
+            return None
 
     entries = {inter.channel}.union(converted or {})
     for entry in entries:
@@ -222,7 +341,10 @@ async def member_converter(
 
     async def _underlying(guild: disnake.Guild) -> t.Optional[disnake.Member]:
         if not (member := guild.get_member(id)) and ALLOW_CONVERTER_FETCHING.USERS:
-            member = await guild.fetch_member(id)
+            try:
+                member = await guild.fetch_member(id)
+            except disnake.NotFound:
+                pass
         return member
 
     entries = {inter.guild}.union(converted or {})
@@ -268,7 +390,10 @@ async def role_converter(
 
     async def _underlying(guild: disnake.Guild) -> t.Optional[disnake.Role]:
         if not (role := guild.get_role(id)) and ALLOW_CONVERTER_FETCHING.GUILDS:
-            all_roles = await guild.fetch_roles()
+            try:
+                all_roles = await guild.fetch_roles()
+            except disnake.NotFound:
+                return None
             role = next((role for role in all_roles if role.id == id), None)
         return role
 
@@ -306,7 +431,7 @@ CONVERTER_MAP: t.Mapping[type, t.Tuple[ConverterSig, ConverterSig]] = {
     str:                      (str,                                              str),
     int:                      (int,                                              str),
     float:                    (float,                                            str),
-    bool:                     (commands.converter._convert_to_bool,              str),
+    bool:                     (bool_converter,                                   str),
     disnake.User:             (user_converter,                                   snowflake_to_str),
     disnake.Member:           (member_converter,                                 snowflake_to_str),
     disnake.Role:             (role_converter,                                   snowflake_to_str),
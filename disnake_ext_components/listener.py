@@ -194,12 +194,13 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
             return
 
         converted: t.Dict[str, t.Any] = {}
+        skip_validation = bool(self.regex)
         for param, arg in zip(self.params, custom_id_params):
             converted[param.name] = await param.convert(
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
+                skip_validation=skip_validation,
             )
 
         return await super().__call__(inter, **converted)
@@ -440,12 +441,13 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
 
         # First convert custom_id params...
         converted: t.Dict[str, t.Any] = {}
+        skip_validation = bool(self.regex)
         for param, arg in zip(self.params, custom_id_params):
             converted[param.name] = await param.convert(
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
+                skip_validation=skip_validation,
             )
 
         # User didn't supply select params, can still be accessed through inter.values; return.
@@ -454,7 +456,7 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
 
         # User did supply select params, convert inter.values and provide it to the param.
         converted_values = await self.select_param.convert(
-            inter.values, inter=inter, converted=converted
+            inter.values, inter=inter, converted=list(converted.values())
         )
 
         return await super().__call__(inter, converted_values, **converted)
@@ -661,12 +663,13 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
             return
 
         converted: t.Dict[str, t.Any] = {}
+        skip_validation = bool(self.regex)
         for param, arg in zip(self.params, custom_id_params):
             converted[param.name] = await param.convert(
                 arg,
                 inter=inter,
                 converted=list(converted.values()),
-                skip_validation=bool(self.regex),
+                skip_validation=skip_validation,
             )
 
         for param, field_id in zip(self.modal_params, self.field_ids):
@@ -713,9 +716,6 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
             components = []
             for param, custom_id in zip(self.modal_params, self.field_ids):
 
-                if not isinstance(modal_value := param.param.default, params._ModalValue):
-                    modal_value = params._ModalValue()
-
                 if isinstance(modal_value := param.param.default, params._ModalValue):
                     placeholder = modal_value.placeholder
                     style = modal_value.style
@@ -27,7 +27,9 @@ T = t.TypeVar("T")
 ArgT = t.TypeVar("ArgT", bound=t.Union[t.List[str], str])
 
 ConverterData = t.Tuple[
-    t.List[t.Pattern[str]], t.Tuple[t.List[converter.ConverterSig], t.List[converter.ConverterSig]]
+    t.List[t.Pattern[str]],
+    t.Tuple[t.List[converter.ConverterSig], t.List[converter.ConverterSig]],
+    t.List[t.Optional[type]],
 ]
 """Parsed converter data."""
 
@@ -53,6 +55,34 @@ REGEX_MAP: t.Dict[type, t.Pattern[str]] = {
     # fmt: on
 }
 
+_STR_REGEX: t.Tuple[t.Tuple[t.Pattern[str], ...], ...] = ((), (patterns.STR,))
+"""Possible regex of a plain :class:`str` parameter, with and without validation. Both accept
+any input.
+"""
+
+
+def _get_converter_params(conv: converter.ConverterSig) -> t.FrozenSet[str]:
+    """For internal use only. Get the names of the parameters a converter function accepts.
+    Resolving a signature is expensive, so this should only be done once per converter.
+    """
+    signature = params.signature(  # pyright: ignore
+        conv.__new__ if isinstance(conv, type) else conv
+    )
+    return frozenset(signature.parameters)
+
+
+def _get_container_type(annotation: t.Any) -> t.Optional[type]:
+    """For internal use only. Get the container type of an annotation, if any. For example,
+    ``List[str]`` would have container type ``list``.
+    """
+    origin = t.get_origin(annotation) or annotation
+    try:
+        if issubclass(origin, t.Collection) and origin not in {str, bytes}:
+            return t.cast(type, origin)
+    except TypeError:
+        pass
+    return None
+
 
 class ParamInfo:
     """Helper class that stores information about a listener parameter. Mainly instantiated
@@ -60,6 +90,17 @@ class ParamInfo:
     to any of the parameter's annotated types.
     """
 
+    __slots__ = (
+        "param",
+        "converters_to",
+        "converters_from",
+        "_converter_params",
+        "regex",
+        "types",
+        "container_type",
+        "_converters_from_by_type",
+    )
+
     param: inspect.Parameter
     """The listener parameter this :class:`ParamInfo` expands on."""
 
@@ -78,6 +119,16 @@ class ParamInfo:
     is not necessary, this list will be empty.
     """
 
+    types: t.Tuple[t.Optional[type]]
+    """A list of the types converted from by the functions in :attr:`converters_from`, in the same
+    order. The type is ``None`` for custom converters, as their type cannot be known.
+    """
+
+    container_type: t.Optional[type]
+    """The container type, if any. For example, a parameter annotated as ``List[str]``
+    would have container type ``list``.
+    """
+
     def __init__(
         self,
         param: inspect.Parameter,
@@ -85,11 +136,16 @@ class ParamInfo:
         converters_to: t.Optional[t.Sequence[converter.ConverterSig]] = None,
         converters_from: t.Optional[t.Sequence[converter.ConverterSig]] = None,
         regex: t.Optional[t.Sequence[t.Pattern[str]]] = None,
+        types: t.Optional[t.Sequence[t.Optional[type]]] = None,
     ) -> None:
         self.param = param
         self.converters_to = () if converters_to is None else tuple(converters_to)
+        self._converter_params = tuple(map(_get_converter_params, self.converters_to))
         self.converters_from = () if converters_from is None else tuple(converters_from)
         self.regex = () if regex is None else tuple(regex)
+        self.types = () if types is None else tuple(types)
+        self.container_type = _get_container_type(param.annotation)
+        self._converters_from_by_type: t.Optional[t.Dict[type, converter.ConverterSig]] = None
 
     @classmethod
     def from_param(cls, param: inspect.Parameter, validate: bool = True) -> ParamInfo:
@@ -102,9 +158,11 @@ class ParamInfo:
         """
         self = cls(param)
 
-        regex, (converters_to, converters_from) = self.parse_annotation()
+        regex, (converters_to, converters_from), types = self.parse_annotation()
         self.converters_to += tuple(converters_to)
+        self._converter_params += tuple(map(_get_converter_params, converters_to))
         self.converters_from += tuple(converters_from)
+        self.types += tuple(types)
         if validate:
             self.regex += tuple(regex)
 
@@ -135,10 +193,12 @@ class ParamInfo:
 
         Returns
         -------
-        Tuple[List[:class:`re.Pattern`], List[:class:`ConverterSig`]]:
+        Tuple[List[:class:`re.Pattern`], Tuple[List[ConverterSig], List[ConverterSig]], List[Optional[type]]]:
             A tuple containing:
             - a list of patterns against which the `custom_id` component will be matched,
-            - a list of converter functions used to convert input to a different type.
+            - a tuple of two lists of converter functions used to convert input to a different
+            type, and back to :class:`str`, respectively,
+            - a list of the types that correspond to these converters.
         """
         if annotation is Ellipsis:
             annotation = self.param.annotation
@@ -151,7 +211,7 @@ class ParamInfo:
 
         if not (origin := types_.get_origin(annotation)):
             conv_to, conv_from = converter.CONVERTER_MAP[annotation]
-            return [REGEX_MAP[annotation]], ([conv_to], [conv_from])
+            return [REGEX_MAP[annotation]], ([conv_to], [conv_from]), [annotation]
 
         elif origin in _UnionTypes:
             return self._parse_union(annotation)
@@ -181,6 +241,7 @@ class ParamInfo:
             regex: t.List[t.Pattern[str]] = []
             conv_to: t.List[converter.ConverterSig] = []
             conv_from: t.List[converter.ConverterSig] = []
+            types: t.List[t.Optional[type]] = []
 
             for arg in types_.get_args(annotation):
                 if arg in _NoneTypes:
@@ -188,12 +249,13 @@ class ParamInfo:
                         self.param = self.param.replace(default=None)
                     continue
 
-                arg_regex, (arg_conv_to, arg_conv_from) = self.parse_annotation(arg)
+                arg_regex, (arg_conv_to, arg_conv_from), arg_types = self.parse_annotation(arg)
                 regex += arg_regex
                 conv_to += arg_conv_to
                 conv_from += arg_conv_from
+                types += arg_types
 
-            return regex, (conv_to, conv_from)
+            return regex, (conv_to, conv_from), types
 
         raise TypeError(f"{annotation!r} is not a valid typing.Union.")
 
@@ -205,14 +267,16 @@ class ParamInfo:
             regex: t.List[t.Pattern[str]] = []
             conv_to: t.List[converter.ConverterSig] = []
             conv_from: t.List[converter.ConverterSig] = []
+            types: t.List[t.Optional[type]] = []
 
             for arg in types_.get_args(annotation):
                 regex.append(re.compile(re.escape(str(arg))))
                 arg_conv_to, arg_conv_from = converter.CONVERTER_MAP[type(arg)]
                 conv_to.append(arg_conv_to)
                 conv_from.append(arg_conv_from)
+                types.append(type(arg))
 
-            return regex, (conv_to, conv_from)
+            return regex, (conv_to, conv_from), types
 
         raise TypeError(f"{annotation!r} is not a valid typing.Literal.")
 
@@ -220,7 +284,11 @@ class ParamInfo:
         """Parse a :class:`.Converted` annotation into the corresponding regex patterns and
         converter functions.
         """
-        return [annotation.regex], ([annotation.converter_to], [annotation.converter_from])
+        return (
+            [annotation.regex],
+            ([annotation.converter_to], [annotation.converter_from]),
+            [None],
+        )
 
     @property
     def default(self) -> t.Any:
@@ -239,27 +307,14 @@ class ParamInfo:
         """Whether or not this parameter is optional. If the parameter is default-less and optional,
         the parameter will instead default to `None`.
         """
-        return self.default not in {inspect.Parameter.empty, Ellipsis}
+        default = self.default
+        return default is not inspect.Parameter.empty and default is not Ellipsis
 
     @property
     def name(self) -> str:
         """The name of the parameter."""
         return self.param.name
 
-    @property
-    def container_type(self) -> t.Optional[type]:
-        """The container type, if any. For example, a parameter annotated as ``List[str]``
-        would have container type ``list``.
-        """
-        annotation = self.param.annotation
-        origin = t.get_origin(annotation) or annotation
-        try:
-            if issubclass(origin, t.Collection) and origin not in {str, bytes}:
-                return t.cast(type, origin)
-        except TypeError:
-            pass
-        return None
-
     @t.overload
     async def convert(self, argument: str, **kwargs: t.Any) -> t.Any:
         ...
@@ -301,21 +356,34 @@ class ParamInfo:
         if not isinstance(argument, str):
             if not self.container_type:
                 if len(argument) == 1:
-                    return await self.convert(argument[0], **kwargs)
+                    return await self._convert_single(argument[0], **kwargs)
 
                 exc = ValueError("Cannot convert a list of arguments to a non-collection type.")
                 raise exceptions.ConversionError(
                     f"Failed to convert parameter {self.param.name}", self.param, [exc]
                 )
 
-            converted = [result for arg in argument for result in await self.convert(arg, **kwargs)]
+            if self.converters_to == (str,) and self.regex in _STR_REGEX:
+                # Strings are always valid and remain unchanged; skip per-argument conversion.
+                return self.container_type(argument)
+
+            converted = [await self._convert_single(arg, **kwargs) for arg in argument]
+            if self.container_type is list:
+                return converted  # Already a fresh list, no need to copy it again.
             return self.container_type(converted)
 
+        converted = await self._convert_single(argument, **kwargs)
+        return self.container_type([converted]) if self.container_type else converted
+
+    async def _convert_single(self, argument: str, **kwargs: t.Any) -> t.Any:
+        """For internal use only. Convert a single input argument, without wrapping the result in
+        the container type of the parameter.
+        """
         method = self._convert_and_validate if self.regex else self._convert_raw
         converted, errors = await method(argument, **kwargs)
 
         if not errors or self.optional:
-            return self.container_type([converted]) if self.container_type else converted
+            return converted
 
         raise exceptions.ConversionError(
             f"Failed to convert parameter {self.param.name}", self.param, errors
@@ -327,9 +395,9 @@ class ParamInfo:
         """For internal use only. Run converters on an argument without regex validation."""
         errors: t.List[ValueError] = []
 
-        for conv in self.converters_to:
+        for conv, conv_params in zip(self.converters_to, self._converter_params):
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, conv_params, **kwargs)
             except ValueError as exc:
                 errors.append(exc)
 
@@ -342,46 +410,52 @@ class ParamInfo:
         can be of the correct type using regex.
         """
         match_cache: t.Set[t.Pattern[str]] = set()  # Prevent matching the same regex again.
-        errors: t.List[ValueError] = []
+        # Failed matches are stored as their pattern; the actual MatchFailure exceptions are only
+        # created if all converters fail, as a later converter succeeding discards all errors.
+        failures: t.List[t.Union[t.Pattern[str], ValueError]] = []
 
-        for regex, conv in zip(self.regex, self.converters_to):
+        for regex, conv, conv_params in zip(
+            self.regex, self.converters_to, self._converter_params
+        ):
             if regex not in match_cache:
                 if regex.fullmatch(argument):
                     match_cache.add(regex)
                 else:
-                    errors.append(
-                        exceptions.MatchFailure(
-                            f"Input '{argument}' did not match r'{regex.pattern}'.",
-                            self.param,
-                            regex,
-                        )
-                    )
+                    failures.append(regex)
                     continue
 
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, conv_params, **kwargs)
             except ValueError as exc:
-                errors.append(exc)
-
+                failures.append(exc)
+
+        errors: t.List[ValueError] = [
+            failure
+            if isinstance(failure, ValueError)
+            else exceptions.MatchFailure(
+                f"Input '{argument}' did not match r'{failure.pattern}'.",
+                self.param,
+                failure,
+            )
+            for failure in failures
+        ]
         return self.default, errors
 
     async def _actual_conversion(
         self,
         argument: str,
         conv: converter.ConverterSig,
+        conv_params: t.FrozenSet[str],
         **kwargs: t.Any,
     ) -> t.Tuple[t.Any, t.List[ValueError]]:
         """For internal use only. Actually run a converter on an argument and return the result.
+        Only the kwargs whose names are in ``conv_params`` are forwarded to the converter.
         Raises whatever the converter function may raise. Generally speaking, this should only be
         :class:`ValueError`s.
         """
-        converter_signature = params.signature(  # pyright: ignore
-            conv.__new__ if isinstance(conv, type) else conv
-        ).parameters
-
         converted = conv(
             argument,
-            **{key: value for key, value in kwargs.items() if key in converter_signature},
+            **{key: value for key, value in kwargs.items() if key in conv_params},
         )
 
         if inspect.isawaitable(converted):
@@ -390,13 +464,23 @@ class ParamInfo:
 
     async def to_str(self, argument: t.Any) -> str:
         errors: t.List[ValueError] = []
-        for conv in self.converters_from:
+
+        # Prefer the converter for the type of the argument, if known. Otherwise, e.g. a
+        # disnake.User passed to a `Union[int, disnake.User]` parameter would be converted by the
+        # converter for int, as that is tried first and simply calls `str`. Custom converters
+        # have no known type, so any converters declared after them are not preferred over them.
+        if (type_conv := self._get_converter_from(argument)) is not None:
             try:
-                converted = conv(argument)
-                if inspect.isawaitable(converted):
-                    return await converted
-                return converted  # type: ignore  # Type not correctly narrowed.
+                return await self._actual_to_str(argument, type_conv)
+            except ValueError as exc:
+                errors.append(exc)
 
+        for conv in self.converters_from:
+            if conv is type_conv:
+                continue
+
+            try:
+                return await self._actual_to_str(argument, conv)
             except ValueError as exc:
                 errors.append(exc)
 
@@ -404,8 +488,41 @@ class ParamInfo:
             f"Failed to convert parameter {self.param.name}", self.param, errors
         )
 
+    def _get_converter_from(self, argument: t.Any) -> t.Optional[converter.ConverterSig]:
+        """For internal use only. Get the converter to :class:`str` for the type of the argument,
+        or the closest of its base classes. Returns ``None`` if no converter is known for any of
+        these types.
+
+        Only converters declared before the first custom converter are considered, as a custom
+        converter may accept any type and must therefore keep its priority in declaration order.
+        """
+        if (by_type := self._converters_from_by_type) is None:
+            by_type = self._converters_from_by_type = {}
+            for type_, conv in zip(self.types, self.converters_from):
+                if type_ is None:
+                    break
+                by_type.setdefault(type_, conv)
+
+        # The first entry of the mro is the type itself, so exact matches are found first.
+        for type_ in type(argument).__mro__:
+            if (conv := by_type.get(type_)) is not None:
+                return conv
+
+        return None
+
+    async def _actual_to_str(self, argument: t.Any, conv: converter.ConverterSig) -> str:
+        """For internal use only. Actually run a converter to :class:`str` on an argument and return
+        the result. Raises whatever the converter function may raise.
+        """
+        converted = conv(argument)
+        if inspect.isawaitable(converted):
+            return await converted
+        return converted  # type: ignore  # Type not correctly narrowed.
+
 
 class _SelectValue:
+    __slots__ = ("placeholder", "min_values", "max_values", "options", "disabled")
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -469,6 +586,16 @@ def SelectValue(
 
 
 class _ModalValue:
+    __slots__ = (
+        "placeholder",
+        "label",
+        "value",
+        "required",
+        "min_length",
+        "max_length",
+        "style",
+    )
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -0,0 +1,268 @@
+import asyncio
+import inspect
+import typing as t
+from unittest import mock
+
+import disnake
+import pytest
+
+import disnake_ext_components as components
+
+
+@pytest.fixture()
+def allow_fetching(monkeypatch: pytest.MonkeyPatch):
+    for attr in ("CHANNELS", "GUILDS", "USERS", "MESSAGES"):
+        monkeypatch.setattr(components.ALLOW_CONVERTER_FETCHING, attr, True)
+
+
+@pytest.fixture()
+def inter(msg_inter: mock.Mock) -> mock.Mock:
+    msg_inter.bot = mock.Mock()
+    msg_inter.channel_id = 0
+    msg_inter.channel = None
+    return msg_inter
+
+
+def not_found() -> disnake.NotFound:
+    return disnake.NotFound(mock.Mock(status=404, reason="Not Found"), "Unknown")
+
+
+def server_error() -> disnake.DiscordServerError:
+    return disnake.DiscordServerError(mock.Mock(status=500, reason="Server Error"), "Oops")
+
+
+async def maybe_await(value: t.Any) -> t.Any:
+    return await value if inspect.isawaitable(value) else value
+
+
+# converter | fetch errors
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_fetch_not_found(inter: mock.Mock):
+    inter.bot.get_user.return_value = None
+    inter.bot.fetch_user = mock.AsyncMock(side_effect=not_found())
+
+    # Objects that do not exist are treated like any other failed conversion...
+    with pytest.raises(ValueError):
+        await maybe_await(components.converter.user_converter("1", inter))
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_fetch_server_error(inter: mock.Mock):
+    inter.bot.get_user.return_value = None
+    inter.bot.fetch_user = mock.AsyncMock(side_effect=server_error())
+
+    # ...but other http errors are not silently turned into a failed conversion.
+    with pytest.raises(disnake.DiscordServerError):
+        await maybe_await(components.converter.user_converter("1", inter))
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_channel_fetch_errors(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    inter.bot.get_channel.return_value = None
+
+    inter.bot.fetch_channel = mock.AsyncMock(side_effect=not_found())
+    with pytest.raises(ValueError):
+        await maybe_await(convert("1", inter))
+
+    inter.bot.fetch_channel = mock.AsyncMock(side_effect=server_error())
+    with pytest.raises(disnake.DiscordServerError):
+        await maybe_await(convert("1", inter))
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_message_fetch_not_found_lookback(inter: mock.Mock):
+    inter._state = mock.Mock()
+    inter._state._get_message.return_value = None
+
+    inter.channel = mock.Mock(spec=disnake.TextChannel)
+    inter.channel.fetch_message = mock.AsyncMock(side_effect=not_found())
+    other_channel = mock.Mock(spec=disnake.TextChannel)
+    other_channel.fetch_message = mock.AsyncMock(side_effect=not_found())
+
+    # A channel that doesn't contain the message should not prevent checking the others, so
+    # every channel is tried once before the conversion fails, regardless of the order.
+    with pytest.raises(ValueError):
+        await components.converter.message_converter("1", inter, [other_channel])
+
+    inter.channel.fetch_message.assert_awaited_once_with(1)
+    other_channel.fetch_message.assert_awaited_once_with(1)
+
+
+# converter.make_channel_converter | concurrent fetches
+
+
+@pytest.fixture()
+def blocking_fetch(inter: mock.Mock) -> asyncio.Event:
+    """Make ``inter.bot.fetch_channel`` block until the returned event is set."""
+    event = asyncio.Event()
+    channel = mock.Mock(spec=disnake.TextChannel)
+
+    async def fetch_channel(id: int) -> disnake.TextChannel:
+        await event.wait()
+        return channel
+
+    inter.bot.get_channel.return_value = None
+    inter.bot.fetch_channel = mock.AsyncMock(side_effect=fetch_channel)
+    return event
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_channel_fetch_shared(inter: mock.Mock, blocking_fetch: asyncio.Event):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+
+    first = asyncio.ensure_future(maybe_await(convert("1", inter)))
+    second = asyncio.ensure_future(maybe_await(convert("1", inter)))
+    await asyncio.sleep(0)  # Let both conversions start waiting on the fetch.
+
+    blocking_fetch.set()
+    assert await first is await second
+    inter.bot.fetch_channel.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_channel_fetch_cleanup(inter: mock.Mock, blocking_fetch: asyncio.Event):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    pending = components.converter._PENDING_CHANNEL_FETCHES  # pyright: ignore
+
+    blocking_fetch.set()
+    await maybe_await(convert("1", inter))
+    await asyncio.sleep(0)
+    assert (inter.bot, 1) not in pending
+
+    inter.bot.fetch_channel = mock.AsyncMock(side_effect=not_found())
+    with pytest.raises(ValueError):
+        await maybe_await(convert("1", inter))
+    await asyncio.sleep(0)
+    assert (inter.bot, 1) not in pending
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_channel_fetch_cancel(inter: mock.Mock, blocking_fetch: asyncio.Event):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+
+    first = asyncio.ensure_future(maybe_await(convert("1", inter)))
+    second = asyncio.ensure_future(maybe_await(convert("1", inter)))
+    await asyncio.sleep(0)
+
+    # Cancelling one conversion must not cancel the fetch the other is waiting on.
+    first.cancel()
+    blocking_fetch.set()
+
+    assert isinstance(await second, disnake.TextChannel)
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+# converter.make_channel_converter
+
+
+def test_channel_cached(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    channel = inter.bot.get_channel.return_value = mock.Mock(spec=disnake.TextChannel)
+
+    # Cached channels are returned directly, without needing to be awaited.
+    assert convert("1", inter) is channel
+    inter.bot.get_channel.assert_called_once_with(1)
+
+
+@pytest.mark.usefixtures("allow_fetching")
+def test_channel_cached_wrong_type(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    inter.bot.get_channel.return_value = mock.Mock(spec=disnake.VoiceChannel)
+
+    # A channel of the wrong type exists, so fetching it again would not help.
+    with pytest.raises(ValueError):
+        convert("1", inter)
+    inter.bot.fetch_channel.assert_not_called()
+
+
+def test_channel_fetching_disabled(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    inter.bot.get_channel.return_value = None
+
+    with pytest.raises(ValueError):
+        convert("1", inter)
+    inter.bot.fetch_channel.assert_not_called()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+async def test_channel_fetch(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    channel = mock.Mock(spec=disnake.TextChannel)
+    inter.bot.get_channel.return_value = None
+    inter.bot.fetch_channel = mock.AsyncMock(return_value=channel)
+
+    result = convert("1", inter)
+    assert inspect.isawaitable(result)
+    assert await result is channel
+    inter.bot.fetch_channel.assert_called_once_with(1)
+
+
+# converter.user_converter / converter.guild_converter
+
+
+@pytest.mark.parametrize("kind", ["user", "guild"])
+def test_cached(inter: mock.Mock, kind: str):
+    convert = getattr(components.converter, f"{kind}_converter")
+    obj = getattr(inter.bot, f"get_{kind}").return_value = mock.Mock()
+
+    # Cached objects are returned directly, without needing to be awaited.
+    assert convert("1", inter) is obj
+
+
+@pytest.mark.parametrize("kind", ["user", "guild"])
+def test_fetching_disabled(inter: mock.Mock, kind: str):
+    convert = getattr(components.converter, f"{kind}_converter")
+    getattr(inter.bot, f"get_{kind}").return_value = None
+
+    with pytest.raises(ValueError):
+        convert("1", inter)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("allow_fetching")
+@pytest.mark.parametrize("kind", ["user", "guild"])
+async def test_fetch(inter: mock.Mock, kind: str):
+    convert = getattr(components.converter, f"{kind}_converter")
+    obj = mock.Mock()
+    getattr(inter.bot, f"get_{kind}").return_value = None
+    setattr(inter.bot, f"fetch_{kind}", fetch := mock.AsyncMock(return_value=obj))
+
+    result = convert("1", inter)
+    assert inspect.isawaitable(result)
+    assert await result is obj
+    fetch.assert_called_once_with(1)
+
+
+# converter.make_channel_converter | interaction channel
+
+
+def test_channel_interaction_channel(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    inter.channel_id = 1
+    inter.channel = mock.Mock(spec=disnake.TextChannel)
+
+    assert convert("1", inter) is inter.channel
+    inter.bot.get_channel.assert_not_called()
+
+
+def test_channel_interaction_channel_wrong_type(inter: mock.Mock):
+    convert = components.converter.make_channel_converter(disnake.TextChannel)
+    inter.channel_id = 1
+    inter.channel = mock.Mock(spec=disnake.Thread)
+    channel = inter.bot.get_channel.return_value = mock.Mock(spec=disnake.TextChannel)
+
+    # The interaction channel is of the wrong type, so the normal lookup should run instead.
+    assert convert("1", inter) is channel
+    inter.bot.get_channel.assert_called_once_with(1)
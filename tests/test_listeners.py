@@ -1,6 +1,7 @@
 # TODO: Add more tests to ensure proper functionality before pypi release!
 
 import typing as t
+from unittest import mock
 
 import disnake
 import pytest
@@ -70,6 +71,79 @@ def test_listener_name_override_modal():
     assert this_should_not_show_up.name == override
 
 
+# abc.BaseListener.parse_custom_id
+
+
+def test_listener_parse_custom_id(button_listener_callback: ListenerCallback):
+    listener = components.button_listener()(button_listener_callback)
+
+    assert listener.parse_custom_id("button_listener_callback:1:abc") == ("1", "abc")
+
+
+@pytest.mark.parametrize(
+    "custom_id",
+    [
+        "button_listener_callback:1",  # Too few params...
+        "button_listener_callback:1:abc:def",  # Too many params...
+        "some_other_listener:1:abc",  # Wrong name...
+    ],
+)
+def test_listener_parse_custom_id_mismatch(
+    button_listener_callback: ListenerCallback, custom_id: str
+):
+    listener = components.button_listener()(button_listener_callback)
+
+    with pytest.raises(ValueError):
+        listener.parse_custom_id(custom_id)
+
+
+# abc.BaseListener.build_custom_id
+
+
+@pytest.mark.asyncio()
+async def test_listener_build_custom_id(button_listener_callback: ListenerCallback):
+    listener = components.button_listener()(button_listener_callback)
+
+    custom_id = await listener.build_custom_id(foo=1, bar="abc")
+    assert custom_id == "button_listener_callback:1:abc"
+    assert listener.parse_custom_id(custom_id) == ("1", "abc")
+
+
+@pytest.mark.asyncio()
+async def test_listener_build_custom_id_regex(button_listener_callback: ListenerCallback):
+    listener = components.button_listener(regex=r"foo-(?P<foo>\d+)-(?P<bar>.*)")(
+        button_listener_callback
+    )
+
+    custom_id = await listener.build_custom_id(foo=1, bar="abc")
+    assert custom_id == "foo-1-abc"
+    assert listener.parse_custom_id(custom_id) == ("1", "abc")
+
+
+# listener.ButtonListener.__call__
+
+
+@pytest.mark.asyncio()
+async def test_listener_lookback_isolated(msg_inter: mock.Mock):
+    seen: t.List[t.List[t.Any]] = []
+
+    def record(arg: str, converted: t.List[t.Any]) -> str:
+        seen.append(list(converted))
+        converted.append("garbage")  # Must not leak into the lookback of other params.
+        return arg
+
+    recorded = components.Converted[components.patterns.STR, record, str]
+
+    @components.button_listener()
+    async def callback(inter: disnake.MessageInteraction, *, foo: recorded, bar: recorded):
+        ...
+
+    msg_inter.component = mock.Mock(custom_id="callback:a:b")
+    await callback(msg_inter)
+
+    assert seen == [[], ["a"]]
+
+
 # TODO: Add tests for match_component naming, though that needs some further work.
 #       Currently, they allow not specifying a name at all, which I doubt actually
 #       offers any useful functionality, and also caused the naming regression.
@@ -1,5 +1,7 @@
+import dataclasses
 import datetime
 import inspect
+import re
 import typing as t
 
 import disnake
@@ -117,6 +119,33 @@ async def test_str_paraminfo():
     assert await paraminfo.convert("True") == "True"
 
 
+# params.ParamInfo | bool
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("argument", "expected"),
+    [("true", True), ("True", True), ("YES", True), ("1", True), ("off", False), ("F", False)],
+)
+async def test_bool_paraminfo(argument: str, expected: bool):
+    param = param_from_annotation(bool)
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert await paraminfo.convert(argument) is expected
+
+
+@pytest.mark.asyncio()
+async def test_bool_paraminfo_fail_skip_validation():
+    param = param_from_annotation(bool)
+    paraminfo = components.params.ParamInfo.from_param(param, validate=False)
+
+    # Conversion failure should be a ValueError, and thus collected into a ConversionError.
+    with pytest.raises(components.ConversionError) as exc_info:
+        await paraminfo.convert("maybe")
+
+    assert len(exc_info.value.errors) == 1
+
+
 # params.ParamInfo | t.Optional
 
 
@@ -153,6 +182,17 @@ async def test_optional_paraminfo_with_default():
     assert await paraminfo.convert("") == default
 
 
+@pytest.mark.asyncio()
+async def test_optional_paraminfo_unhashable_default():
+    default: t.List[int] = []
+    param = param_from_annotation(t.List[int], default=default)
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert paraminfo.default is default
+    assert paraminfo.optional is True
+    assert await paraminfo.convert(["1", "2"]) == [1, 2]
+
+
 # params.ParamInfo | t.Union
 
 
@@ -176,6 +216,36 @@ async def test_union_paraminfo():
     assert await paraminfo_switched.convert("1") is True
 
 
+@pytest.mark.asyncio()
+async def test_union_paraminfo_to_str():
+    param = param_from_annotation(t.Union[int, disnake.Permissions])
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert await paraminfo.to_str(123) == "123"
+
+    # Ensure the converter for the type of the argument is used, even though int comes first.
+    assert await paraminfo.to_str(disnake.Permissions(8)) == "8"
+
+
+def from_hex(arg: str) -> int:
+    return int(arg, 16)
+
+
+def to_hex(arg: int) -> str:
+    return format(arg, "x")
+
+
+@pytest.mark.asyncio()
+async def test_union_paraminfo_to_str_converted_first():
+    hex_converted = components.Converted[re.compile(r"[0-9a-f]+"), from_hex, to_hex]
+    param = param_from_annotation(t.Union[hex_converted, int])  # pyright: ignore
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    # The custom converter is declared first, so it must take priority over the one for int.
+    assert await paraminfo.to_str(255) == "ff"
+    assert await paraminfo.convert(await paraminfo.to_str(255)) == 255
+
+
 # params.ParamInfo | t.Literal
 
 
@@ -254,6 +324,24 @@ async def test_converted_paraminfo(
     assert await paraminfo.to_str(dt) == "0"
 
 
+@dataclasses.dataclass
+class OffsetConverter:  # Defines __eq__ without __hash__, and is thus unhashable.
+    offset: int
+
+    def __call__(self, arg: str, inter: disnake.Interaction) -> int:
+        return int(arg) + self.offset
+
+
+@pytest.mark.asyncio()
+async def test_unhashable_converted_paraminfo():
+    param = param_from_annotation(
+        components.Converted[components.patterns.STRICTINT, OffsetConverter(1), str]
+    )
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    assert await paraminfo.convert("1", inter=None, converted=[]) == 2
+
+
 # params.ParamInfo | exc
 
 